@@ -36,6 +36,8 @@ from .features.file_workspace import FileWorkspaceMixin
 
 logger = logging.getLogger(__name__)
 
+_UNINDENT_PATTERN = re.compile(r"\n\s+")
+
 
 class PlanningAgent(ContextMixin, FileWorkspaceMixin, BaseAgent):
     """Agent class for interacting with AutoGPT."""
@@ -204,8 +206,7 @@ class PlanningAgent(ContextMixin, FileWorkspaceMixin, BaseAgent):
                     f"Unknown thought process '{thought_process_id}'"
                 )
 
-        response_format = re.sub(
-            r"\n\s+",
+        response_format = _UNINDENT_PATTERN.sub(
             "\n",
             response_format,
         )
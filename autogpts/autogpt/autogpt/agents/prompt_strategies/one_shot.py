@@ -30,6 +30,8 @@ from autogpt.core.utils.json_schema import JSONSchema
 from autogpt.json_utils.utilities import extract_dict_from_response
 from autogpt.prompts.utils import format_numbered_list, indent
 
+_UNINDENT_PATTERN = re.compile(r"\n\s+")
+
 
 class OneShotAgentPromptConfiguration(SystemConfiguration):
     DEFAULT_BODY_TEMPLATE: str = (
@@ -301,8 +303,7 @@ class OneShotAgentPromptStrategy(PromptStrategy):
             del response_schema.properties["command"]
 
         # Unindent for performance
-        response_format = re.sub(
-            r"\n\s+",
+        response_format = _UNINDENT_PATTERN.sub(
             "\n",
             response_schema.to_typescript_object_interface("Response"),
         )
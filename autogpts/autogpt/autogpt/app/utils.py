@@ -14,6 +14,9 @@ from autogpt.config import Config
 logger = logging.getLogger(__name__)
 session = PromptSession(history=InMemoryHistory())
 
+_BOLD_PATTERN = re.compile(r"(?<!\*)\*(\*?[^*]+\*?)\*(?!\*)")
+_HEADING_PATTERN = re.compile(r"^#+ ")
+
 
 async def clean_input(config: Config, prompt: str = ""):
     try:
@@ -62,7 +65,8 @@ async def clean_input(config: Config, prompt: str = ""):
 def get_bulletin_from_web():
     try:
         response = requests.get(
-            "https://raw.githubusercontent.com/Significant-Gravitas/AutoGPT/master/autogpts/autogpt/BULLETIN.md"
+            "https://raw.githubusercontent.com/Significant-Gravitas/AutoGPT/master/autogpts/autogpt/BULLETIN.md",
+            timeout=10,
         )
         if response.status_code == 200:
             return response.text
@@ -114,15 +118,15 @@ def markdown_to_ansi_style(markdown: str):
         if line.startswith("# "):
             line_style += Style.BRIGHT
         else:
-            line = re.sub(
-                r"(?<!\*)\*(\*?[^*]+\*?)\*(?!\*)",
+            line = _BOLD_PATTERN.sub(
                 rf"{Style.BRIGHT}\1{Style.NORMAL}",
                 line,
             )
 
-        if re.match(r"^#+ ", line) is not None:
+        heading = _HEADING_PATTERN.match(line)
+        if heading is not None:
             line_style += Fore.CYAN
-            line = re.sub(r"^#+ ", "", line)
+            line = line[heading.end() :]
 
         ansi_lines.append(f"{line_style}{line}{Style.RESET_ALL}")
     return "\n".join(ansi_lines)
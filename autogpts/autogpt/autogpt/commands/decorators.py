@@ -11,6 +11,8 @@ T = TypeVar("T")
 
 logger = logging.getLogger(__name__)
 
+_WORKSPACE_PREFIX_PATTERN = re.compile(r"^\/workspace")
+
 
 def sanitize_path_arg(
     arg_name: str, make_relative: bool = False
@@ -52,7 +54,7 @@ def sanitize_path_arg(
             if given_path:
                 if type(given_path) is str:
                     # Fix workspace path from output in docker environment
-                    given_path = re.sub(r"^\/workspace", ".", given_path)
+                    given_path = _WORKSPACE_PREFIX_PATTERN.sub(".", given_path)
 
                 if given_path in {"", "/", "."}:
                     sanitized_path = agent.workspace.root
@@ -208,7 +208,8 @@ def validate_command(command: str, config: Config) -> bool:
     if not command:
         return False
 
-    command_name = command.split()[0]
+    # Only the first token is checked; don't tokenize the whole command line
+    command_name = command.split(maxsplit=1)[0]
 
     if config.shell_command_control == ALLOWLIST_CONTROL:
         return command_name in config.shell_allowlist
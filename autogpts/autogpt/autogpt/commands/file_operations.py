@@ -9,9 +9,8 @@ import contextlib
 import hashlib
 import logging
 import os
-import os.path
 from pathlib import Path
-from typing import Iterator, Literal
+from typing import Iterator, Literal, TextIO
 
 from autogpt.agents.agent import Agent
 from autogpt.agents.utils.exceptions import DuplicateOperationError
@@ -59,6 +58,11 @@ def operations_from_log(
     log.close()
 
 
+# Cache of parsed operations logs, keyed by path and invalidated when the
+# log file's size or mtime changes
+_operations_state_cache: dict[str, tuple[tuple[int, int], dict[str, str]]] = {}
+
+
 def file_operations_state(log_path: str | Path) -> dict[str, str]:
     """Iterates over the operations log and returns the expected state.
 
@@ -73,12 +77,24 @@ def file_operations_state(log_path: str | Path) -> dict[str, str]:
         FileNotFoundError: If file_manager.file_ops_log_path is not found.
         ValueError: If the log file content is not in the expected format.
     """
+    try:
+        log_stat = os.stat(log_path)
+    except FileNotFoundError:
+        return {}
+
+    log_signature = (log_stat.st_mtime_ns, log_stat.st_size)
+    cached = _operations_state_cache.get(str(log_path))
+    if cached and cached[0] == log_signature:
+        return cached[1]
+
     state = {}
     for operation, path, checksum in operations_from_log(log_path):
         if operation in ("write", "append"):
             state[path] = checksum
         elif operation == "delete":
             del state[path]
+
+    _operations_state_cache[str(log_path)] = (log_signature, state)
     return state
 
 
@@ -128,9 +144,22 @@ def log_operation(
     if checksum is not None:
         log_entry += f" #{checksum}"
     logger.debug(f"Logging file operation: {log_entry}")
-    append_to_file(
-        agent.file_manager.file_ops_log_path, f"{log_entry}\n", agent, should_log=False
-    )
+    log_file = _get_ops_log_file(agent.file_manager.file_ops_log_path)
+    log_file.write(f"{log_entry}\n")
+    log_file.flush()
+
+
+# Open operations log files, kept open for the lifetime of the process so that
+# logging an operation doesn't pay an open/close cycle per entry
+_ops_log_files: dict[Path, TextIO] = {}
+
+
+def _get_ops_log_file(log_path: Path) -> TextIO:
+    log_file = _ops_log_files.get(log_path)
+    if log_file is None or log_file.closed:
+        os.makedirs(os.path.dirname(log_path), exist_ok=True)
+        log_file = _ops_log_files[log_path] = open(log_path, "a", encoding="utf-8")
+    return log_file
 
 
 @command(
@@ -274,13 +303,14 @@ def list_folder(folder: Path, agent: Agent) -> list[str]:
     """
     found_files = []
 
+    workspace_root = agent.workspace.root
     for root, _, files in os.walk(folder):
+        # Compute the directory's path relative to the workspace once,
+        # instead of once per file in it
+        relative_root = os.path.relpath(root, workspace_root)
         for file in files:
             if file.startswith("."):
                 continue
-            relative_path = os.path.relpath(
-                os.path.join(root, file), agent.workspace.root
-            )
-            found_files.append(relative_path)
+            found_files.append(os.path.normpath(os.path.join(relative_root, file)))
 
     return found_files
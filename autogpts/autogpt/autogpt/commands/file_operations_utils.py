@@ -22,9 +22,16 @@ class ParserStrategy:
 # Basic text file reading
 class TXTParser(ParserStrategy):
     def read(self, file_path: Path) -> str:
-        charset_match = charset_normalizer.from_path(file_path).best()
-        logger.debug(f"Reading '{file_path}' with encoding '{charset_match.encoding}'")
-        return str(charset_match)
+        # Nearly all text files are UTF-8; only run (expensive) charset
+        # detection when strict decoding fails.
+        try:
+            return file_path.read_text(encoding="utf-8")
+        except UnicodeDecodeError:
+            charset_match = charset_normalizer.from_path(file_path).best()
+            logger.debug(
+                f"Reading '{file_path}' with encoding '{charset_match.encoding}'"
+            )
+            return str(charset_match)
 
 
 # Reading text from binary file using pdf parser
@@ -130,7 +137,7 @@ extension_to_parser = {
 
 
 def is_file_binary_fn(file_path: Path):
-    """Given a file path load all its content and checks if the null bytes is present
+    """Given a file path read it in chunks and check if the null byte is present
 
     Args:
         file_path (_type_): _description_
@@ -139,9 +146,9 @@ def is_file_binary_fn(file_path: Path):
         bool: is_binary
     """
     with open(file_path, "rb") as f:
-        file_data = f.read()
-    if b"\x00" in file_data:
-        return True
+        while chunk := f.read(65536):
+            if b"\x00" in chunk:
+                return True
     return False
 
 
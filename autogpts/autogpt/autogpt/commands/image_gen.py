@@ -86,6 +86,7 @@ def generate_image_with_hf(prompt: str, filename: str, agent: Agent) -> str:
             json={
                 "inputs": prompt,
             },
+            timeout=60,
         )
 
         if response.ok:
@@ -194,6 +195,7 @@ def generate_image_with_sd_webui(
             "n_iter": 1,
             **extra,
         },
+        timeout=60,
     )
 
     logger.info(f"Image Generated for prompt:{prompt}")
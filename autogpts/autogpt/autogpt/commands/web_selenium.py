@@ -11,7 +11,7 @@ from pathlib import Path
 from sys import platform
 from typing import TYPE_CHECKING, Optional, Type
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from selenium.common.exceptions import WebDriverException
 from selenium.webdriver.chrome.options import Options as ChromeOptions
 from selenium.webdriver.chrome.service import Service as ChromeDriverService
@@ -47,9 +47,22 @@ from autogpt.url_utils.validators import validate_url
 logger = logging.getLogger(__name__)
 
 FILE_DIR = Path(__file__).parent.parent
+_UNKNOWN_ERROR_PREFIX_PATTERN = re.compile(r"^unknown error: ")
 TOKENS_TO_TRIGGER_SUMMARY = 50
 LINKS_TO_RETURN = 20
 
+BROWSER_USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+    " (KHTML, like Gecko) Chrome/112.0.5615.49 Safari/537.36"
+)
+
+BROWSER_OPTIONS_AVAILABLE: dict[str, Type[BrowserOptions]] = {
+    "chrome": ChromeOptions,
+    "edge": EdgeOptions,
+    "firefox": FirefoxOptions,
+    "safari": SafariOptions,
+}
+
 
 class BrowsingError(CommandExecutionError):
     """An error occurred while trying to browse the page"""
@@ -125,7 +138,7 @@ async def read_webpage(url: str, agent: Agent, question: str = "") -> str:
         if "net::" in msg:
             raise BrowsingError(
                 f"A networking error occurred while trying to load the page: "
-                + re.sub(r"^unknown error: ", "", msg)
+                + _UNKNOWN_ERROR_PREFIX_PATTERN.sub("", msg)
             )
         raise CommandExecutionError(msg)
     finally:
@@ -145,15 +158,20 @@ def scrape_text_with_selenium(driver: WebDriver) -> str:
 
     # Get the HTML content directly from the browser's DOM
     page_source = driver.execute_script("return document.body.outerHTML;")
-    soup = BeautifulSoup(page_source, "html.parser")
+    soup = BeautifulSoup(page_source, "lxml")
 
+    # decompose() frees the pruned subtrees instead of keeping them alive
+    # like extract() does
     for script in soup(["script", "style"]):
-        script.extract()
-
-    text = soup.get_text()
-    lines = (line.strip() for line in text.splitlines())
-    chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-    text = "\n".join(chunk for chunk in chunks if chunk)
+        script.decompose()
+
+    # Normalize whitespace in a single pass over the extracted text
+    text = "\n".join(
+        phrase
+        for line in soup.get_text().splitlines()
+        for phrase in (chunk.strip() for chunk in line.split("  "))
+        if phrase
+    )
     return text
 
 
@@ -168,10 +186,11 @@ def scrape_links_with_selenium(driver: WebDriver, base_url: str) -> list[str]:
         List[str]: The links scraped from the website
     """
     page_source = driver.page_source
-    soup = BeautifulSoup(page_source, "html.parser")
-
-    for script in soup(["script", "style"]):
-        script.extract()
+    # Only the hyperlinks are needed, so skip building a tree for the rest of
+    # the page (this also makes pruning script/style tags unnecessary)
+    soup = BeautifulSoup(
+        page_source, "lxml", parse_only=SoupStrainer("a", href=True)
+    )
 
     hyperlinks = extract_hyperlinks(soup, base_url)
 
@@ -190,17 +209,8 @@ def open_page_in_browser(url: str, config: Config) -> WebDriver:
     """
     logging.getLogger("selenium").setLevel(logging.CRITICAL)
 
-    options_available: dict[str, Type[BrowserOptions]] = {
-        "chrome": ChromeOptions,
-        "edge": EdgeOptions,
-        "firefox": FirefoxOptions,
-        "safari": SafariOptions,
-    }
-
-    options: BrowserOptions = options_available[config.selenium_web_browser]()
-    options.add_argument(
-        "user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/112.0.5615.49 Safari/537.36"
-    )
+    options: BrowserOptions = BROWSER_OPTIONS_AVAILABLE[config.selenium_web_browser]()
+    options.add_argument(f"user-agent={BROWSER_USER_AGENT}")
 
     if config.selenium_web_browser == "firefox":
         if config.selenium_headless:
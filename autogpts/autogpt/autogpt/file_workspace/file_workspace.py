@@ -25,6 +25,8 @@ class FileWorkspace:
     """
 
     def __init__(self, root: str | Path, restrict_to_root: bool):
+        # Resolve the root once up front; get_path() can then join against it
+        # without re-resolving it on every access.
         self._root = self._sanitize_path(root)
         self._restrict_to_root = restrict_to_root
 
@@ -111,18 +113,20 @@ class FileWorkspace:
         """
 
         # Posix systems disallow null bytes in paths. Windows is agnostic about it.
-        # Do an explicit check here for all sorts of null byte representations.
+        # All escaped representations in NULL_BYTES denote the same character, so a
+        # single containment check covers them all.
 
-        for null_byte in FileWorkspace.NULL_BYTES:
-            if null_byte in str(relative_path) or null_byte in str(root):
-                raise ValueError("embedded null byte")
+        if "\0" in str(relative_path) or "\0" in str(root):
+            raise ValueError("embedded null byte")
 
         if root is None:
             return Path(relative_path).resolve()
 
         logger.debug(f"Resolving path '{relative_path}' in workspace '{root}'")
 
-        root, relative_path = Path(root).resolve(), Path(relative_path)
+        root, relative_path = Path(root), Path(relative_path)
+        if not root.is_absolute():
+            root = root.resolve()
 
         logger.debug(f"Resolved root as '{root}'")
 
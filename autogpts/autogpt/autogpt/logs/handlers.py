@@ -14,6 +14,10 @@ if TYPE_CHECKING:
     from autogpt.speech import TTSConfig
 
 
+# Split without discarding whitespace
+_WORD_PATTERN = re.compile(r"\S+\s*")
+
+
 class TypingConsoleHandler(logging.StreamHandler):
     """Output stream to console using simulated typing"""
 
@@ -27,8 +31,7 @@ class TypingConsoleHandler(logging.StreamHandler):
 
         msg = self.format(record)
         try:
-            # Split without discarding whitespace
-            words = re.findall(r"\S+\s*", msg)
+            words = _WORD_PATTERN.findall(msg)
 
             for i, word in enumerate(words):
                 self.stream.write(word)
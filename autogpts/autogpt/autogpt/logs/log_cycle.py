@@ -1,8 +1,9 @@
-import json
 import os
 from pathlib import Path
 from typing import Any, Dict, Union
 
+import orjson
+
 from .config import LOG_DIR
 
 DEFAULT_PREFIX = "agent"
@@ -72,10 +73,12 @@ class LogCycleHandler:
         """
         cycle_log_dir = self.create_nested_directory(ai_name, created_at, cycle_count)
 
-        json_data = json.dumps(data, ensure_ascii=False, indent=4)
+        json_data = orjson.dumps(
+            data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        )
         log_file_path = cycle_log_dir / f"{self.log_count_within_cycle}_{file_name}"
 
-        with open(log_file_path, "w", encoding="utf-8") as f:
-            f.write(json_data + "\n")
+        with open(log_file_path, "wb") as f:
+            f.write(json_data + b"\n")
 
         self.log_count_within_cycle += 1
@@ -1,5 +1,7 @@
 import re
 
+_ANSI_ESCAPE_PATTERN = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
+
 
 def remove_color_codes(s: str) -> str:
-    return re.sub(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])", "", s)
+    return _ANSI_ESCAPE_PATTERN.sub("", s)
@@ -8,6 +8,7 @@ import logging
 import os
 import sys
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import TYPE_CHECKING, List
 from urllib.parse import urlparse
@@ -59,6 +60,59 @@ def write_dict_to_json_file(data: dict, file_path: str) -> None:
         json.dump(data, file, indent=4)
 
 
+def _fetch_openai_plugin_manifest_and_spec(url: str, config: Config) -> dict | None:
+    """
+    Fetch the manifest and OpenAPI spec for a single OpenAI plugin.
+        Args:
+        url (str): URL of the plugin.
+        config (Config): Config instance including plugins config
+    Returns:
+        dict | None: manifest and spec, or None if the plugin is unsupported.
+    """
+    openai_plugin_client_dir = f"{config.plugins_dir}/openai/{urlparse(url).netloc}"
+    create_directory_if_not_exists(openai_plugin_client_dir)
+    if not os.path.exists(f"{openai_plugin_client_dir}/ai-plugin.json"):
+        try:
+            response = requests.get(
+                f"{url}/.well-known/ai-plugin.json", timeout=10
+            )
+            if response.status_code == 200:
+                manifest = response.json()
+                if manifest["schema_version"] != "v1":
+                    logger.warn(
+                        f"Unsupported manifest version: {manifest['schem_version']} for {url}"
+                    )
+                    return None
+                if manifest["api"]["type"] != "openapi":
+                    logger.warn(
+                        f"Unsupported API type: {manifest['api']['type']} for {url}"
+                    )
+                    return None
+                write_dict_to_json_file(
+                    manifest, f"{openai_plugin_client_dir}/ai-plugin.json"
+                )
+            else:
+                logger.warn(
+                    f"Failed to fetch manifest for {url}: {response.status_code}"
+                )
+        except requests.exceptions.RequestException as e:
+            logger.warn(f"Error while requesting manifest from {url}: {e}")
+    else:
+        logger.info(f"Manifest for {url} already exists")
+        manifest = json.load(open(f"{openai_plugin_client_dir}/ai-plugin.json"))
+    if not os.path.exists(f"{openai_plugin_client_dir}/openapi.json"):
+        openapi_spec = openapi_python_client._get_document(
+            url=manifest["api"]["url"], path=None, timeout=5
+        )
+        write_dict_to_json_file(
+            openapi_spec, f"{openai_plugin_client_dir}/openapi.json"
+        )
+    else:
+        logger.info(f"OpenAPI spec for {url} already exists")
+        openapi_spec = json.load(open(f"{openai_plugin_client_dir}/openapi.json"))
+    return {"manifest": manifest, "openapi_spec": openapi_spec}
+
+
 def fetch_openai_plugins_manifest_and_spec(config: Config) -> dict:
     """
     Fetch the manifest for a list of OpenAI plugins.
@@ -68,49 +122,22 @@ def fetch_openai_plugins_manifest_and_spec(config: Config) -> dict:
         dict: per url dictionary of manifest and spec.
     """
     # TODO add directory scan
-    manifests = {}
-    for url in config.plugins_openai:
-        openai_plugin_client_dir = f"{config.plugins_dir}/openai/{urlparse(url).netloc}"
-        create_directory_if_not_exists(openai_plugin_client_dir)
-        if not os.path.exists(f"{openai_plugin_client_dir}/ai-plugin.json"):
-            try:
-                response = requests.get(f"{url}/.well-known/ai-plugin.json")
-                if response.status_code == 200:
-                    manifest = response.json()
-                    if manifest["schema_version"] != "v1":
-                        logger.warn(
-                            f"Unsupported manifest version: {manifest['schem_version']} for {url}"
-                        )
-                        continue
-                    if manifest["api"]["type"] != "openapi":
-                        logger.warn(
-                            f"Unsupported API type: {manifest['api']['type']} for {url}"
-                        )
-                        continue
-                    write_dict_to_json_file(
-                        manifest, f"{openai_plugin_client_dir}/ai-plugin.json"
-                    )
-                else:
-                    logger.warn(
-                        f"Failed to fetch manifest for {url}: {response.status_code}"
-                    )
-            except requests.exceptions.RequestException as e:
-                logger.warn(f"Error while requesting manifest from {url}: {e}")
-        else:
-            logger.info(f"Manifest for {url} already exists")
-            manifest = json.load(open(f"{openai_plugin_client_dir}/ai-plugin.json"))
-        if not os.path.exists(f"{openai_plugin_client_dir}/openapi.json"):
-            openapi_spec = openapi_python_client._get_document(
-                url=manifest["api"]["url"], path=None, timeout=5
-            )
-            write_dict_to_json_file(
-                openapi_spec, f"{openai_plugin_client_dir}/openapi.json"
-            )
-        else:
-            logger.info(f"OpenAPI spec for {url} already exists")
-            openapi_spec = json.load(open(f"{openai_plugin_client_dir}/openapi.json"))
-        manifests[url] = {"manifest": manifest, "openapi_spec": openapi_spec}
-    return manifests
+    urls = config.plugins_openai
+    if not urls:
+        return {}
+
+    # Each plugin is fetched independently, so do them concurrently instead of
+    # paying one network round trip after another.
+    with ThreadPoolExecutor(max_workers=min(8, len(urls))) as executor:
+        results = executor.map(
+            lambda url: _fetch_openai_plugin_manifest_and_spec(url, config), urls
+        )
+
+    return {
+        url: manifest_spec
+        for url, manifest_spec in zip(urls, results)
+        if manifest_spec is not None
+    }
 
 
 def create_directory_if_not_exists(directory_path: str) -> bool:
@@ -15,9 +15,18 @@ def extract_hyperlinks(soup: BeautifulSoup, base_url: str) -> list[tuple[str, st
     Returns:
         List[Tuple[str, str]]: The extracted hyperlinks
     """
+    # Pages often repeat the same href (nav menus, pagination); resolving each
+    # unique href once avoids re-parsing the base URL for every occurrence
+    resolved: dict[str, str] = {}
+
+    def resolve(href: str) -> str:
+        url = resolved.get(href)
+        if url is None:
+            url = resolved[href] = urljoin(base_url, href)
+        return url
+
     return [
-        (link.text, urljoin(base_url, link["href"]))
-        for link in soup.find_all("a", href=True)
+        (link.text, resolve(link["href"])) for link in soup.find_all("a", href=True)
     ]
 
 
@@ -5,6 +5,11 @@ import abc
 import re
 from threading import Lock
 
+# Deliberately simple: a nested-quantifier URL pattern here can backtrack
+# catastrophically on adversarial LLM output. Match the scheme, take the rest
+# of the token, and drop any trailing dots from the match.
+_URL_PATTERN = re.compile(r"\bhttps?://\S+(?<!\.)")
+
 
 class VoiceBase:
     """
@@ -30,11 +35,7 @@ class VoiceBase:
             text (str): The text to say.
             voice_index (int): The index of the voice to use.
         """
-        text = re.sub(
-            r"\b(?:https?://[-\w_.]+/?\w[-\w_.]*\.(?:[-\w_.]+/?\w[-\w_.]*\.)?[a-z]+(?:/[-\w_.%]+)*\b(?!\.))",
-            "",
-            text,
-        )
+        text = _URL_PATTERN.sub("", text)
         with self._mutex:
             return self._speech(text, voice_index)
 
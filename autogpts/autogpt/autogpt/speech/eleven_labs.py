@@ -79,7 +79,9 @@ class ElevenLabsSpeech(VoiceBase):
         tts_url = (
             f"https://api.elevenlabs.io/v1/text-to-speech/{self._voices[voice_index]}"
         )
-        response = requests.post(tts_url, headers=self._headers, json={"text": text})
+        response = requests.post(
+            tts_url, headers=self._headers, json={"text": text}, timeout=30
+        )
 
         if response.status_code == 200:
             with open("speech.mpeg", "wb") as f:
@@ -37,7 +37,7 @@ class StreamElementsSpeech(VoiceBase):
         tts_url = (
             f"https://api.streamelements.com/kappa/v2/speech?voice={voice}&text={text}"
         )
-        response = requests.get(tts_url)
+        response = requests.get(tts_url, timeout=30)
 
         if response.status_code == 200:
             with open("speech.mp3", "wb") as f:
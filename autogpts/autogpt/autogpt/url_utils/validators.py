@@ -1,5 +1,4 @@
 import functools
-import re
 from typing import Any, Callable, ParamSpec, TypeVar
 from urllib.parse import urljoin, urlparse
 
@@ -25,7 +24,7 @@ def validate_url(func: Callable[P, T]) -> Callable[P, T]:
             ValueError if the url fails any of the validation tests
         """
         # Most basic check if the URL is valid:
-        if not re.match(r"^https?://", url):
+        if not url.startswith(("http://", "https://")):
             raise ValueError("Invalid URL format")
         if not is_valid_url(url):
             raise ValueError("Missing Scheme or Network location")
@@ -71,6 +70,33 @@ def sanitize_url(url: str) -> str:
     return urljoin(url, reconstructed_url)
 
 
+LOCAL_FILE_PREFIXES = (
+    "file:///",
+    "file://localhost/",
+    "file://localhost",
+    "http://localhost",
+    "http://localhost/",
+    "https://localhost",
+    "https://localhost/",
+    "http://2130706433",
+    "http://2130706433/",
+    "https://2130706433",
+    "https://2130706433/",
+    "http://127.0.0.1/",
+    "http://127.0.0.1",
+    "https://127.0.0.1/",
+    "https://127.0.0.1",
+    "https://0.0.0.0/",
+    "https://0.0.0.0",
+    "http://0.0.0.0/",
+    "http://0.0.0.0",
+    "http://0000",
+    "http://0000/",
+    "https://0000",
+    "https://0000/",
+)
+
+
 def check_local_file_access(url: str) -> bool:
     """Check if the URL is a local file
 
@@ -80,29 +106,4 @@ def check_local_file_access(url: str) -> bool:
     Returns:
         bool: True if the URL is a local file, False otherwise
     """
-    local_prefixes = [
-        "file:///",
-        "file://localhost/",
-        "file://localhost",
-        "http://localhost",
-        "http://localhost/",
-        "https://localhost",
-        "https://localhost/",
-        "http://2130706433",
-        "http://2130706433/",
-        "https://2130706433",
-        "https://2130706433/",
-        "http://127.0.0.1/",
-        "http://127.0.0.1",
-        "https://127.0.0.1/",
-        "https://127.0.0.1",
-        "https://0.0.0.0/",
-        "https://0.0.0.0",
-        "http://0.0.0.0/",
-        "http://0.0.0.0",
-        "http://0000",
-        "http://0000/",
-        "https://0000",
-        "https://0000/",
-    ]
-    return any(url.startswith(prefix) for prefix in local_prefixes)
+    return url.startswith(LOCAL_FILE_PREFIXES)
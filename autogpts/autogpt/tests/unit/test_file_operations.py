@@ -125,6 +125,19 @@ def test_file_operations_state(test_file: TextIOWrapper):
     assert file_ops.file_operations_state(test_file.name) == expected_state
 
 
+def test_file_operations_state_cache_invalidation(test_file: TextIOWrapper):
+    test_file.write("write: path/to/file1.txt #checksum1\n")
+    test_file.flush()
+    assert file_ops.file_operations_state(test_file.name) == {
+        "path/to/file1.txt": "checksum1"
+    }
+
+    # Appending to the log must invalidate the cached state
+    test_file.write("delete: path/to/file1.txt\n")
+    test_file.close()
+    assert file_ops.file_operations_state(test_file.name) == {}
+
+
 def test_is_duplicate_operation(agent: Agent, mocker: MockerFixture):
     # Prepare a fake state dictionary for the function to use
     state = {